@@ -24,6 +24,8 @@ class ASTAnalyzer:
 
         # Current state
         self.current_parse_result: Optional[ParseResult] = None
+        self.current_file_path: Optional[Path] = None
+        self._current_file_stamp: Optional[Tuple[int, int]] = None
 
     def load_file(self, file_path: Path) -> None:
         """
@@ -37,6 +39,16 @@ class ASTAnalyzer:
             ValueError: If file encoding not supported
             SyntaxError: If file has syntax errors
         """
+        # The same file is often loaded again by another pipeline stage sharing this
+        # analyzer; keep the current parse result if the file is unchanged on disk.
+        # A matching stat stamp alone is not enough: a same-size rewrite within one
+        # mtime tick keeps it, so the content is compared as well
+        file_stamp = self._get_file_stamp(file_path)
+        if (file_stamp is not None and file_path == self.current_file_path
+                and file_stamp == self._current_file_stamp
+                and self._read_source(file_path) == self.current_parse_result.source_code):
+            return
+
         parse_result = self.parser.parse_file(file_path)
 
         if not parse_result.success:
@@ -48,6 +60,26 @@ class ASTAnalyzer:
                 raise SyntaxError(parse_result.error_message)
 
         self.current_parse_result = parse_result
+        self.current_file_path = file_path
+        self._current_file_stamp = file_stamp
+
+    @staticmethod
+    def _get_file_stamp(file_path: Path) -> Optional[Tuple[int, int]]:
+        """Get (mtime_ns, size) of a file, or None if it cannot be stat'ed."""
+        try:
+            stat = Path(file_path).stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _read_source(file_path: Path) -> Optional[str]:
+        """Read a file's source the way the parser does, or None if it cannot be read."""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except (OSError, UnicodeDecodeError):
+            return None
 
     def load_source(self, source_code: str) -> None:
         """
@@ -65,6 +97,8 @@ class ASTAnalyzer:
             raise SyntaxError(parse_result.error_message)
 
         self.current_parse_result = parse_result
+        self.current_file_path = None
+        self._current_file_stamp = None
 
     @property
     def original_source(self) -> str:
@@ -176,4 +210,24 @@ class ASTAnalyzer:
         if not self.current_parse_result:
             return []
 
-        return self.parser.get_imports(self.current_parse_result.tree)
\ No newline at end of file
+        return self.parser.get_imports(self.current_parse_result.tree)
+
+
+# Analyzer shared by the pipeline stages of this process
+_shared_ast_analyzer: Optional[ASTAnalyzer] = None
+
+
+def get_shared_analyzer() -> ASTAnalyzer:
+    """
+    Get the ASTAnalyzer shared by SymbolAnalyzer and RuleEngine.
+
+    Sharing one analyzer lets a stage reuse the parse result of a file that
+    the previous stage already loaded.
+
+    Returns:
+        Process-wide ASTAnalyzer instance
+    """
+    global _shared_ast_analyzer
+    if _shared_ast_analyzer is None:
+        _shared_ast_analyzer = ASTAnalyzer()
+    return _shared_ast_analyzer
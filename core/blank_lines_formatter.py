@@ -3,11 +3,17 @@ Blank Lines Formatter for Python Style Converter.
 Handles the remaining formatting functionality - adding blank lines after classes and functions.
 """
 
+import re
 from typing import Optional
 
 from config.config_manager import ConfigManager
 
 
+# A line that starts a class, function or async function definition and ends with a colon.
+# Group 1 is set for class definitions.
+_DEFINITION_HEADER_RE = re.compile(r'^[^\S\n]*(?:(class )|def |async def )[^\n]*:[^\S\n]*$', re.MULTILINE)
+
+
 class BlankLinesFormatter:
     """Handles blank lines formatting for classes and functions."""
 
@@ -20,9 +26,14 @@ class BlankLinesFormatter:
         """
         self.config = config_manager
 
+        # Snapshot settings; configuration does not change during a run
+        self._enabled = config_manager.is_rule_enabled('blank_lines')
+        self.blank_lines_after_class = config_manager.get_blank_lines_after_class()
+        self.blank_lines_after_function = config_manager.get_blank_lines_after_function()
+
     def is_formatting_enabled(self) -> bool:
         """Check if blank lines formatting rule is enabled."""
-        return self.config.is_rule_enabled('blank_lines')
+        return self._enabled
 
     def apply_blank_lines_formatting(self, source_code: str) -> Optional[str]:
         """
@@ -54,32 +65,19 @@ class BlankLinesFormatter:
         Returns:
             Source code with blank lines added
         """
-        lines = source_code.split('\n')
-        formatted_lines = []
-
-        # This is a simplified implementation
-        # You'd want to use AST to properly identify class/function boundaries
-        # But for now, using regex patterns for simplicity
-
-        for i, line in enumerate(lines):
-            formatted_lines.append(line)
-
-            # Add blank lines after class definitions
-            if line.strip().startswith('class ') and line.strip().endswith(':'):
-                blank_lines = self.config.get_blank_lines_after_class()
-                for _ in range(blank_lines):
-                    formatted_lines.append('')
-
-            # Add blank lines after function definitions
-            elif line.strip().startswith('def ') and line.strip().endswith(':'):
-                blank_lines = self.config.get_blank_lines_after_function()
-                for _ in range(blank_lines):
-                    formatted_lines.append('')
-
-            # Also handle async functions
-            elif line.strip().startswith('async def ') and line.strip().endswith(':'):
-                blank_lines = self.config.get_blank_lines_after_function()
-                for _ in range(blank_lines):
-                    formatted_lines.append('')
-
-        return '\n'.join(formatted_lines)
\ No newline at end of file
+        # Find class/function header lines in one pass and splice the blank lines in after them
+        pieces = []
+        position = 0
+
+        for match in _DEFINITION_HEADER_RE.finditer(source_code):
+            if match.group(1):
+                blank_lines = self.blank_lines_after_class
+            else:
+                blank_lines = self.blank_lines_after_function
+
+            pieces.append(source_code[position:match.end()])
+            pieces.append('\n' * blank_lines)
+            position = match.end()
+
+        pieces.append(source_code[position:])
+        return ''.join(pieces)
@@ -4,9 +4,11 @@ Handles recursive file discovery based on include/exclude patterns.
 """
 
 import os
+import queue
 import fnmatch
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set, Generator
+from typing import List, Set, Generator, Iterator
 from config.config_manager import ConfigManager
 
 
@@ -35,6 +37,51 @@ class FileScanner:
         Returns:
             List of Path objects for matching files
         """
+        directory_path = self._resolve_directory(directory)
+        return list(self._iter_matching_files(directory_path))
+
+    def stream_directory(self, directory: str) -> Iterator[Path]:
+        """
+        Scan directory on a background thread, yielding matching files as they are found.
+
+        Files are yielded in the same sorted order as scan_directory, so callers can
+        start working on the first files while the rest of the tree is still being walked.
+
+        Args:
+            directory: Path to directory to scan
+
+        Yields:
+            Path objects for matching files
+        """
+        directory_path = self._resolve_directory(directory)
+        found_files = queue.Queue()
+        done = object()
+
+        def produce() -> None:
+            try:
+                for file_path in self._iter_matching_files(directory_path):
+                    found_files.put(file_path)
+            finally:
+                found_files.put(done)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            scan = executor.submit(produce)
+            while (file_path := found_files.get()) is not done:
+                yield file_path
+
+            # Re-raise any error from the scanning thread
+            scan.result()
+
+    def _resolve_directory(self, directory: str) -> Path:
+        """
+        Resolve and validate a directory to scan.
+
+        Args:
+            directory: Path to directory to scan
+
+        Returns:
+            Resolved Path of the directory
+        """
         directory_path = Path(directory).resolve()
 
         if not directory_path.exists():
@@ -43,18 +90,26 @@ class FileScanner:
         if not directory_path.is_dir():
             raise ValueError(f"Path is not a directory: {directory}")
 
-        found_files = []
+        return directory_path
 
+    def _iter_matching_files(self, directory_path: Path) -> Generator[Path, None, None]:
+        """
+        Yield files under directory_path that match the configured patterns, in sorted order.
+
+        Args:
+            directory_path: Resolved directory to scan
+
+        Yields:
+            Path objects for matching files
+        """
         if self.recursive:
-            for file_path in self._scan_recursive(directory_path):
-                if self._should_include_file(file_path):
-                    found_files.append(file_path)
+            candidates = self._scan_recursive(directory_path)
         else:
-            for file_path in directory_path.iterdir():
-                if file_path.is_file() and self._should_include_file(file_path):
-                    found_files.append(file_path)
+            candidates = (item for item in sorted(directory_path.iterdir()) if item.is_file())
 
-        return sorted(found_files)
+        for file_path in candidates:
+            if self._should_include_file(file_path):
+                yield file_path
 
     def scan_file(self, file_path: str) -> List[Path]:
         """
@@ -90,7 +145,9 @@ class FileScanner:
             Path objects for all files found
         """
         try:
-            for item in directory.iterdir():
+            # Visiting entries in sorted order yields files in the same order as sorting
+            # the whole result, without having to wait for the full walk
+            for item in sorted(directory.iterdir()):
                 if item.is_file():
                     yield item
                 elif item.is_dir() and not self._should_exclude_directory(item):
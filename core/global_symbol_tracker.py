@@ -3,7 +3,7 @@ Global Symbol Tracker for Python Style Converter.
 Simplified orchestrator for analyzing cross-file symbol definitions and usages.
 """
 
-from typing import Dict, List, Set, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Set, Optional, Tuple, Any
 from pathlib import Path
 from collections import defaultdict
 
@@ -27,39 +27,42 @@ class GlobalSymbolTracker:
         self.module_mapper = ModuleMapper(project_root)
         self.symbol_analyzer = SymbolAnalyzer()
 
-    def analyze_project(self, file_paths: List[Path]) -> GlobalSymbolMap:
+    def analyze_project(self, file_paths: Iterable[Path]) -> GlobalSymbolMap:
         """
         Analyze all files in the project to build a global symbol map.
 
+        Files are analyzed one at a time as they are produced, so file_paths may be a
+        streaming scanner; the analyzed files are recorded in the map's file_to_module.
+
         Args:
-            file_paths: List of Python files to analyze
+            file_paths: Python files to analyze
 
         Returns:
             GlobalSymbolMap containing cross-file symbol information
         """
-        print(f"🔍 Analyzing {len(file_paths)} files for cross-file symbols...")
+        print("🔍 Analyzing project files for cross-file symbols...")
 
-        # First pass: Build file-to-module mapping
-        self.symbol_map.file_to_module, self.symbol_map.module_to_file = (
-            self.module_mapper.build_module_mapping(file_paths)
-        )
+        file_to_module = self.symbol_map.file_to_module
+        module_to_file = self.symbol_map.module_to_file
 
-        # Second pass: Extract definitions and imports
+        # Extract module name, definitions, imports and usages file by file
         for file_path in file_paths:
+            module_name = self.module_mapper.get_module_name(file_path)
+            file_to_module[file_path] = module_name
+            module_to_file[module_name] = file_path
+
             try:
                 self._analyze_file_definitions(file_path)
                 self._analyze_file_imports(file_path)
             except Exception as e:
                 print(f"⚠️  Warning: Could not analyze {file_path}: {e}")
-                continue
 
-        # Third pass: Find symbol usages
-        for file_path in file_paths:
+            # Usages only depend on this file's own imports, so analyze them while
+            # the file's tree is still loaded from the definitions pass
             try:
                 self._analyze_file_usages(file_path)
             except Exception as e:
                 print(f"⚠️  Warning: Could not analyze usages in {file_path}: {e}")
-                continue
 
         self._print_analysis_summary()
         return self.symbol_map
@@ -3,7 +3,6 @@ Module Mapper for Python Style Converter.
 Handles mapping between file paths and Python module names.
 """
 
-from typing import Dict, List
 from pathlib import Path
 
 
@@ -19,26 +18,6 @@ class ModuleMapper:
         """
         self.project_root = project_root
 
-    def build_module_mapping(self, file_paths: List[Path]) -> tuple[Dict[Path, str], Dict[str, Path]]:
-        """
-        Build mapping between file paths and Python module names.
-
-        Args:
-            file_paths: List of Python files to map
-
-        Returns:
-            Tuple of (file_to_module, module_to_file) dictionaries
-        """
-        file_to_module = {}
-        module_to_file = {}
-
-        for file_path in file_paths:
-            module_name = self._file_path_to_module_name(file_path)
-            file_to_module[file_path] = module_name
-            module_to_file[module_name] = file_path
-
-        return file_to_module, module_to_file
-
     def _file_path_to_module_name(self, file_path: Path) -> str:
         """
         Convert file path to module name.
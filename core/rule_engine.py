@@ -4,13 +4,16 @@ Simplified orchestrator that coordinates naming transformations and formatting.
 Enhanced with cross-file symbol tracking and coordinated renaming.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+import os
 import re
 
 from config.config_manager import ConfigManager
-from .ast_analyzer import ASTAnalyzer
+from .ast_analyzer import get_shared_analyzer
 from .code_element_extractor import CodeElement
 from .code_transformer import TransformationResult
 from .global_symbol_tracker import GlobalSymbolMap
@@ -19,8 +22,36 @@ from .blank_lines_formatter import BlankLinesFormatter
 from .docstring_formatter import DocstringFormatter
 from .global_transformation_generator import GlobalTransformationGenerator, GlobalTransformation
 
+# Fewer files than this are processed in-process; below it, starting worker processes and
+# pickling the config and global symbol map into each costs more than it saves
+_PARALLEL_MIN_FILES = 32
 
-@dataclass
+# Compiled whole-word patterns kept per set of names; files affected by the same global
+# transformations share one
+_NAME_PATTERN_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=_NAME_PATTERN_CACHE_SIZE)
+def _compile_name_pattern(names: FrozenSet[str]) -> re.Pattern:
+    """Compile a pattern matching any of the names as a whole word."""
+    return re.compile(r'\b(?:' + '|'.join(map(re.escape, names)) + r')\b')
+
+
+def _mentions_any_name(source_code: str, names: Dict[str, str]) -> bool:
+    """
+    Check whether any of the given identifiers appears as a whole word in the source.
+
+    Args:
+        source_code: Source code to scan
+        names: Mapping whose keys are the identifiers to look for
+
+    Returns:
+        True if at least one identifier occurs in the source, False otherwise
+    """
+    return _compile_name_pattern(frozenset(names)).search(source_code) is not None
+
+
+@dataclass(slots=True)
 class ProcessingResult:
     """Result of processing a single file."""
     file_path: Path
@@ -31,7 +62,7 @@ class ProcessingResult:
     error_message: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectProcessingResult:
     """Result of processing an entire project with cross-file coordination."""
     file_results: List[ProcessingResult]
@@ -56,11 +87,16 @@ class RuleEngine:
         self.global_symbol_map = global_symbol_map
 
         # Initialize components
-        self.analyzer = ASTAnalyzer()
+        self.analyzer = get_shared_analyzer()
         self.naming_converter = NamingConverter(config_manager)
         self.formatter = BlankLinesFormatter(config_manager)
         self.docstring_formatter = DocstringFormatter(config_manager)
 
+        # Snapshot rule toggles; configuration does not change during a run
+        self._naming_enabled = self.naming_converter.is_naming_rules_enabled()
+        self._docstring_formatting_enabled = self.docstring_formatter.is_formatting_enabled()
+        self._formatting_enabled = self.formatter.is_formatting_enabled()
+
         # Initialize cross-file components if available
         if global_symbol_map:
             self.global_transformation_generator = GlobalTransformationGenerator(
@@ -90,24 +126,30 @@ class RuleEngine:
             self.global_transformations = self.global_transformation_generator.generate_global_transformations()
 
             # Step 2: Process each file with BOTH local and global context
-            file_results = []
-            cross_file_changes = {}
-
-            for file_path in file_paths:
-                print(f"🔄 Processing {file_path} with combined local + cross-file context...")
-
-                # Get cross-file transformations that affect this file
-                cross_file_transformations = self.global_transformation_generator.get_transformations_for_file(
+            # Get cross-file transformations that affect each file
+            tasks = [
+                (file_path, self.global_transformation_generator.get_transformations_for_file(
                     file_path, self.global_transformations
-                )
-
-                # Process the file with BOTH local and cross-file transformations
-                result = self._process_file_with_combined_context(file_path, cross_file_transformations)
-                file_results.append(result)
-
-                # Track cross-file changes
-                if result.success and result.changes_made:
-                    cross_file_changes[file_path] = result.changes_made
+                ))
+                for file_path in file_paths
+            ]
+
+            # Files are independent once the global plan exists, so spread larger projects
+            # across processes; progress is reported here as results arrive, in file order
+            if len(tasks) >= _PARALLEL_MIN_FILES:
+                with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(tasks)),
+                                         initializer=_init_worker,
+                                         initargs=(self.config, self.global_symbol_map)) as executor:
+                    file_results = _report_file_results(executor.map(_process_file_worker, tasks))
+            else:
+                file_results = _report_file_results(_process_file_task(self, task) for task in tasks)
+
+            # Track cross-file changes
+            cross_file_changes = {
+                result.file_path: result.changes_made
+                for result in file_results
+                if result.success and result.changes_made
+            }
 
             success = all(result.success for result in file_results)
 
@@ -170,29 +212,25 @@ class RuleEngine:
             local_transformations = {}
             local_changes = []
 
-            if self.naming_converter.is_naming_rules_enabled():
-                for element in elements:
-                    new_name = self.naming_converter.get_transformed_name(element)
-                    if new_name and new_name != element.name:
+            if self._naming_enabled:
+                new_names = self._get_transformed_names(elements)
+                for element, new_name in zip(elements, new_names):
+                    # Skip names that a cross-file transformation overrides anyway
+                    if new_name and new_name != element.name and element.name not in cross_file_transformations:
                         local_transformations[element.name] = new_name
                         local_changes.append(f"Renamed {element.element_type} '{element.name}' to '{new_name}'")
 
+            # Local transformations rename definitions extracted from this very source
+            has_local_transformations = bool(local_transformations)
+
             # Step 2: Combine local and cross-file transformations
             # Cross-file transformations override local ones if there's a conflict
-            combined_transformations = {**local_transformations, **cross_file_transformations}
+            # (local_transformations is built fresh per file, so merge in place)
+            local_transformations.update(cross_file_transformations)
+            combined_transformations = local_transformations
 
             # Step 3: Generate combined change descriptions
-            all_changes = []
-
-            # Add local changes (that aren't overridden by cross-file)
-            for change in local_changes:
-                # Extract the old name from the change description
-                match = re.search(r"'([^']+)' to '([^']+)'", change)
-                if match:
-                    old_name = match.group(1)
-                    # Only add if this wasn't overridden by cross-file transformation
-                    if old_name not in cross_file_transformations:
-                        all_changes.append(change)
+            all_changes = local_changes
 
             # Add cross-file changes
             for old_name, new_name in cross_file_transformations.items():
@@ -200,26 +238,28 @@ class RuleEngine:
                 symbol_type = self.global_transformation_generator.get_symbol_type_for_file(old_name, file_path)
                 all_changes.append(f"Renamed {symbol_type} '{old_name}' to '{new_name}' (cross-file)")
 
-            # Step 4: Apply combined transformations if any
+            # Step 4: Apply combined transformations if any of them occur in the source; only
+            # the cross-file names need checking, and their set repeats across files
             transformed_code = original_code
-            if combined_transformations:
+            if has_local_transformations or (
+                    cross_file_transformations
+                    and _mentions_any_name(original_code, cross_file_transformations)):
                 try:
                     # Always use formatting-preserving transformation for naming changes
                     transformed_code = self.analyzer.apply_transformations_preserve_formatting(combined_transformations)
-                    print(f"🎯 Applied {len(combined_transformations)} transformations to {file_path} (formatting preserved)")
 
                 except Exception as e:
                     raise ValueError(f"Error applying combined transformations: {e}")
 
             # Step 5: Apply docstring formatting if enabled
-            if self.docstring_formatter.is_formatting_enabled():
+            if self._docstring_formatting_enabled:
                 docstring_result, docstring_changes = self.docstring_formatter.apply_docstring_formatting(transformed_code)
                 if docstring_result:
                     transformed_code = docstring_result
                     all_changes.extend(docstring_changes)
 
             # Step 6: Apply blank lines formatting if enabled
-            if self.formatter.is_formatting_enabled():
+            if self._formatting_enabled:
                 formatting_result = self.formatter.apply_blank_lines_formatting(transformed_code)
                 if formatting_result:
                     transformed_code = formatting_result
@@ -304,21 +344,21 @@ class RuleEngine:
             all_changes = []
 
             # Apply naming convention transformations
-            if self.naming_converter.is_naming_rules_enabled():
+            if self._naming_enabled:
                 naming_result = self._apply_naming_transformations(elements)
                 if naming_result:
                     transformed_code = naming_result.transformed_code
                     all_changes.extend(naming_result.changes_made)
 
             # Apply docstring formatting transformations
-            if self.docstring_formatter.is_formatting_enabled():
+            if self._docstring_formatting_enabled:
                 docstring_result, docstring_changes = self.docstring_formatter.apply_docstring_formatting(transformed_code)
                 if docstring_result:
                     transformed_code = docstring_result
                     all_changes.extend(docstring_changes)
 
             # Apply blank lines formatting transformations
-            if self.formatter.is_formatting_enabled():
+            if self._formatting_enabled:
                 formatting_result = self.formatter.apply_blank_lines_formatting(transformed_code)
                 if formatting_result:
                     transformed_code = formatting_result
@@ -343,6 +383,31 @@ class RuleEngine:
                 error_message=str(e)
             )
 
+    def _get_transformed_names(self, elements: List[CodeElement]) -> List[Optional[str]]:
+        """
+        Get the transformed name for each code element, batched by element type.
+
+        Args:
+            elements: List of code elements to potentially transform
+
+        Returns:
+            List aligned with elements holding the new name or None
+        """
+        # Group element indices by type so each type is resolved only once
+        by_type: Dict[str, List[int]] = {}
+        for index, element in enumerate(elements):
+            by_type.setdefault(element.element_type, []).append(index)
+
+        new_names: List[Optional[str]] = [None] * len(elements)
+        for element_type, indices in by_type.items():
+            group_names = self.naming_converter.batch_transform(
+                element_type, [elements[index].name for index in indices]
+            )
+            for index, new_name in zip(indices, group_names):
+                new_names[index] = new_name
+
+        return new_names
+
     def _apply_naming_transformations(self, elements: List[CodeElement]) -> Optional[TransformationResult]:
         """
         Apply naming convention transformations to code elements.
@@ -357,8 +422,8 @@ class RuleEngine:
         changes_made = []
         elements_changed = []
 
-        for element in elements:
-            new_name = self.naming_converter.get_transformed_name(element)
+        new_names = self._get_transformed_names(elements)
+        for element, new_name in zip(elements, new_names):
             if new_name and new_name != element.name:
                 transformations[element.name] = new_name
                 changes_made.append(f"Renamed {element.element_type} '{element.name}' to '{new_name}'")
@@ -379,4 +444,39 @@ class RuleEngine:
                 elements_changed=elements_changed
             )
         except Exception as e:
-            raise ValueError(f"Error applying naming transformations: {e}")
\ No newline at end of file
+            raise ValueError(f"Error applying naming transformations: {e}")
+
+
+# RuleEngine owned by a process_project worker process
+_worker_engine: Optional[RuleEngine] = None
+
+
+def _init_worker(config_manager: ConfigManager, global_symbol_map: GlobalSymbolMap) -> None:
+    """Build the RuleEngine used by the current worker process."""
+    global _worker_engine
+    _worker_engine = RuleEngine(config_manager, global_symbol_map)
+
+
+def _process_file_worker(task: Tuple[Path, Dict[str, str]]) -> ProcessingResult:
+    """Process one (file_path, cross_file_transformations) task in a worker process."""
+    return _process_file_task(_worker_engine, task)
+
+
+def _process_file_task(engine: RuleEngine, task: Tuple[Path, Dict[str, str]]) -> ProcessingResult:
+    """Process one file with BOTH local and cross-file transformations."""
+    file_path, cross_file_transformations = task
+    return engine._process_file_with_combined_context(file_path, cross_file_transformations)
+
+
+def _report_file_results(results: Iterable[ProcessingResult]) -> List[ProcessingResult]:
+    """Print a progress line for each file result as it arrives and collect the results."""
+    file_results = []
+    for result in results:
+        if not result.success:
+            print(f"❌ Failed to process {result.file_path}: {result.error_message}")
+        elif result.changes_made:
+            print(f"🎯 Processed {result.file_path}: {len(result.changes_made)} changes (formatting preserved)")
+        else:
+            print(f"🔄 Processed {result.file_path}: no changes needed")
+        file_results.append(result)
+    return file_results
@@ -4,11 +4,12 @@ Analyzes individual files for symbol definitions, usages, and imports.
 """
 
 import ast
-from typing import Dict, List, Set, Optional, Tuple
+from sys import intern
+from typing import Dict, Iterator, List, Set, Optional, Tuple
 from pathlib import Path
 
 from .symbol_definitions import SymbolDefinition, SymbolUsage, ImportStatement
-from .ast_analyzer import ASTAnalyzer
+from .ast_analyzer import get_shared_analyzer
 
 
 class SymbolAnalyzer:
@@ -16,57 +17,61 @@ class SymbolAnalyzer:
 
     def __init__(self):
         """Initialize the symbol analyzer."""
-        self.analyzer = ASTAnalyzer()
+        self.analyzer = get_shared_analyzer()
 
-    def analyze_file_definitions(self, file_path: Path) -> List[SymbolDefinition]:
+    def analyze_file_definitions(self, file_path: Path) -> Iterator[SymbolDefinition]:
         """
         Analyze a single file for symbol definitions.
 
+        Definitions are produced lazily; wrap the result in list() when all of
+        them are needed at once.
+
         Args:
             file_path: Path to the file to analyze
 
-        Returns:
-            List of SymbolDefinition objects
+        Yields:
+            SymbolDefinition objects
         """
         try:
             self.analyzer.load_file(file_path)
             elements = self.analyzer.extract_code_elements()
-
-            # Convert CodeElements to SymbolDefinitions
-            definitions = []
-            for element in elements:
-                symbol_def = SymbolDefinition(
-                    name=element.name,
-                    symbol_type=element.element_type,
-                    file_path=file_path,
-                    line_number=element.line_number,
-                    context=element.context,
-                    element=element
-                )
-                definitions.append(symbol_def)
-
-            return definitions
-
         except (FileNotFoundError, UnicodeDecodeError, SyntaxError):
-            return []
-
-    def analyze_file_imports(self, file_path: Path) -> List[ImportStatement]:
+            return
+
+        # Convert CodeElements to SymbolDefinitions
+        for element in elements:
+            yield SymbolDefinition(
+                name=intern(element.name),
+                symbol_type=intern(element.element_type),
+                file_path=file_path,
+                line_number=element.line_number,
+                context=intern(element.context),
+                element=element
+            )
+
+    def analyze_file_imports(self, file_path: Path, tree: Optional[ast.AST] = None) -> List[ImportStatement]:
         """
         Analyze import statements in a file.
 
         Args:
             file_path: Path to the file to analyze
+            tree: Already parsed AST of the file; if omitted, the tree loaded by
+                  analyze_file_definitions is reused when it belongs to this file
 
         Returns:
             List of ImportStatement objects
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source_code = f.read()
+        if tree is None and self.analyzer.current_file_path == file_path:
+            tree = self.analyzer.tree
 
-            tree = ast.parse(source_code)
-        except (FileNotFoundError, UnicodeDecodeError, SyntaxError):
-            return []
+        if tree is None:
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    source_code = f.read()
+
+                tree = ast.parse(source_code)
+            except (FileNotFoundError, UnicodeDecodeError, SyntaxError):
+                return []
 
         imports = []
 
@@ -78,7 +83,7 @@ class SymbolAnalyzer:
                         file_path=file_path,
                         line_number=node.lineno,
                         import_type='import',
-                        module_name=alias.name,
+                        module_name=intern(alias.name),
                         imported_names=[alias.name],
                         aliases={alias.name: alias.asname} if alias.asname else {}
                     )
@@ -99,7 +104,7 @@ class SymbolAnalyzer:
                         file_path=file_path,
                         line_number=node.lineno,
                         import_type='from_import',
-                        module_name=node.module,
+                        module_name=intern(node.module),
                         imported_names=imported_names,
                         aliases=aliases
                     )
@@ -107,98 +112,103 @@ class SymbolAnalyzer:
 
         return imports
 
-    def analyze_file_usages(self, file_path: Path, imported_symbols: Dict[str, str]) -> List[SymbolUsage]:
+    def analyze_file_usages(self, file_path: Path, imported_symbols: Dict[str, str],
+                            tree: Optional[ast.AST] = None) -> List[SymbolUsage]:
         """
         Analyze symbol usages in a file.
 
         Args:
             file_path: Path to the file to analyze
             imported_symbols: Dictionary of imported symbols for this file
+            tree: Already parsed AST of the file; if omitted, the tree loaded by
+                  analyze_file_definitions is reused when it belongs to this file
 
         Returns:
             List of SymbolUsage objects
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source_code = f.read()
-
-            tree = ast.parse(source_code)
-        except (FileNotFoundError, UnicodeDecodeError, SyntaxError):
-            return []
+        if tree is None and self.analyzer.current_file_path == file_path:
+            tree = self.analyzer.tree
 
-        usages = []
+        if tree is None:
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    source_code = f.read()
 
-        class UsageVisitor(ast.NodeVisitor):
-            def __init__(self, analyzer, file_path, imported_symbols):
-                self.analyzer = analyzer
-                self.file_path = file_path
-                self.imported_symbols = imported_symbols
-
-            def visit_Name(self, node):
-                # Direct symbol usage
-                if isinstance(node.ctx, ast.Load):  # Symbol is being read/used
-                    usage = SymbolUsage(
-                        name=node.id,
-                        usage_type='direct',
-                        file_path=self.file_path,
-                        line_number=node.lineno,
-                        context='direct_usage'
-                    )
-                    usages.append(usage)
+                tree = ast.parse(source_code)
+            except (FileNotFoundError, UnicodeDecodeError, SyntaxError):
+                return []
 
-                self.generic_visit(node)
+        usages = []
 
-            def visit_Attribute(self, node):
-                # Handle attribute access like module.symbol
-                if isinstance(node.value, ast.Name):
-                    # This is module.attribute pattern
-                    module_name = node.value.id
-                    attribute_name = node.attr
+        # Bind node classes once; the handlers read them as closure cells
+        # instead of resolving the ast module attribute for every node
+        _Load, _Name, _Attr = ast.Load, ast.Name, ast.Attribute
 
-                    usage = SymbolUsage(
-                        name=attribute_name,
+        def handle_name(node):
+            # Direct symbol usage
+            if node.ctx.__class__ is _Load:  # Symbol is being read/used
+                usages.append(SymbolUsage(
+                    name=intern(node.id),
+                    usage_type='direct',
+                    file_path=file_path,
+                    line_number=node.lineno,
+                    context='direct_usage'
+                ))
+
+        def handle_attribute(node):
+            # Handle attribute access like module.symbol
+            if node.value.__class__ is _Name:
+                # This is module.attribute pattern
+                module_name = node.value.id
+                attribute_name = node.attr
+
+                usages.append(SymbolUsage(
+                    name=intern(attribute_name),
+                    usage_type='attribute_access',
+                    file_path=file_path,
+                    line_number=node.lineno,
+                    context=intern(f'attribute_access_on_{module_name}'),
+                    module_context=intern(module_name)
+                ))
+
+        def handle_call(node):
+            # Handle function/class calls
+            if node.func.__class__ is _Name:
+                # Direct call like MyClass() or my_function()
+                usages.append(SymbolUsage(
+                    name=intern(node.func.id),
+                    usage_type='direct',
+                    file_path=file_path,
+                    line_number=node.lineno,
+                    context='function_call'
+                ))
+            elif node.func.__class__ is _Attr:
+                # Handle module.function() calls
+                if node.func.value.__class__ is _Name:
+                    module_name = node.func.value.id
+                    function_name = node.func.attr
+
+                    usages.append(SymbolUsage(
+                        name=intern(function_name),
                         usage_type='attribute_access',
-                        file_path=self.file_path,
-                        line_number=node.lineno,
-                        context=f'attribute_access_on_{module_name}',
-                        module_context=module_name
-                    )
-                    usages.append(usage)
-
-                self.generic_visit(node)
-
-            def visit_Call(self, node):
-                # Handle function/class calls
-                if isinstance(node.func, ast.Name):
-                    # Direct call like MyClass() or my_function()
-                    usage = SymbolUsage(
-                        name=node.func.id,
-                        usage_type='direct',
-                        file_path=self.file_path,
+                        file_path=file_path,
                         line_number=node.lineno,
-                        context='function_call'
-                    )
-                    usages.append(usage)
-                elif isinstance(node.func, ast.Attribute):
-                    # Handle module.function() calls
-                    if isinstance(node.func.value, ast.Name):
-                        module_name = node.func.value.id
-                        function_name = node.func.attr
-
-                        usage = SymbolUsage(
-                            name=function_name,
-                            usage_type='attribute_access',
-                            file_path=self.file_path,
-                            line_number=node.lineno,
-                            context=f'method_call_on_{module_name}',
-                            module_context=module_name
-                        )
-                        usages.append(usage)
-
-                self.generic_visit(node)
-
-        visitor = UsageVisitor(self, file_path, imported_symbols)
-        visitor.visit(tree)
+                        context=intern(f'method_call_on_{module_name}'),
+                        module_context=intern(module_name)
+                    ))
+
+        dispatch = {_Name: handle_name, _Attr: handle_attribute, ast.Call: handle_call}
+        iter_child_nodes = ast.iter_child_nodes
+
+        # Iterative pre-order traversal; children are pushed reversed so usages
+        # keep the same source order a recursive NodeVisitor would produce
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            handler = dispatch.get(node.__class__)
+            if handler is not None:
+                handler(node)
+            stack.extend(reversed(list(iter_child_nodes(node))))
 
         return usages
 
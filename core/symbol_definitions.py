@@ -11,7 +11,7 @@ from collections import defaultdict
 from core.code_element_extractor import CodeElement
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolDefinition:
     """Represents where a symbol is defined."""
     name: str
@@ -22,7 +22,7 @@ class SymbolDefinition:
     element: CodeElement  # Reference to the original CodeElement
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolUsage:
     """Represents where a symbol is used."""
     name: str
@@ -33,7 +33,7 @@ class SymbolUsage:
     module_context: Optional[str] = None  # For attribute access like 'module.symbol'
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportStatement:
     """Represents an import statement."""
     file_path: Path
@@ -44,7 +44,7 @@ class ImportStatement:
     aliases: Dict[str, str] = field(default_factory=dict)  # name -> alias mapping
 
 
-@dataclass
+@dataclass(slots=True)
 class GlobalSymbolMap:
     """Complete cross-file symbol mapping."""
     definitions: Dict[str, List[SymbolDefinition]] = field(default_factory=lambda: defaultdict(list))
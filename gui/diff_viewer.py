@@ -6,11 +6,46 @@ Highlights specific changes with colors.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import difflib
 import re
-from typing import List, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Tuple
 from pathlib import Path
 
+# Prefer the C implementation of SequenceMatcher when available (same API)
+try:
+    from cdifflib import CSequenceMatcher as SequenceMatcher
+except ImportError:
+    from difflib import SequenceMatcher
+
+# Optional C implementation of an edit-distance line diff, used for long files
+try:
+    from rapidfuzz.distance import Levenshtein
+except ImportError:
+    Levenshtein = None
+
+
+# Changed-region line count from which the line diff uses rapidfuzz instead of SequenceMatcher
+_RAPIDFUZZ_MIN_LINES = 500
+
+# Number of (original, modified) pairs whose computed diff is kept for re-display
+_DIFF_CACHE_SIZE = 32
+
+# Combined size in characters above which the diff is computed on a worker thread
+_BACKGROUND_DIFF_SIZE = 100_000
+
+# Milliseconds between checks for a diff being computed on the worker thread
+_DIFF_POLL_MS = 20
+
+# Word and non-word runs used to diff changed lines token by token
+_TOKEN_RE = re.compile(r'\w+|\W+')
+
+# Rows materialized above and below the visible part of a text widget
+_OVERSCAN_LINES = 50
+
+# Tags applied by compute_line_tags
+_HIGHLIGHT_TAGS = ("removed_word", "added_word", "removed_line", "added_line")
+
 
 class SimpleDiffViewer:
     """GUI window for displaying side-by-side code diffs with change highlighting."""
@@ -24,6 +59,26 @@ class SimpleDiffViewer:
         # Result variables
         self.result = None  # Will be "apply", "skip", or "quit"
         self.apply_to_all = False
+        self._centered = False
+        self._result_var = tk.StringVar(self.root)  # Set by the buttons; show_diff waits on it
+
+        # Closing the window counts as quitting; keep the root alive so waiting ends cleanly
+        self.root.protocol("WM_DELETE_WINDOW", lambda: self._result_var.set("quit"))
+
+        # (original_code, modified_code) -> result of compute_diff, LRU order
+        self._diff_cache = OrderedDict()
+
+        # Large diffs are computed here so the window stays responsive
+        self._diff_executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_diff = None
+
+        # Lazily rendered documents: text widget -> (lines, line_tags, rendered flags)
+        self._documents = {}
+        self._render_pending = False
+
+        # Text indices "N.0" and "N.end" for line index N-1, grown as longer documents load
+        self._line_starts = ()
+        self._line_ends = ()
 
         self.create_widgets()
 
@@ -50,6 +105,10 @@ class SimpleDiffViewer:
                                font=("Arial", 9), foreground="gray")
         scroll_info.pack(anchor=tk.W, pady=(5, 0))
 
+        # Shown while a large diff is being computed
+        self.diff_status_label = ttk.Label(main_frame, text="", font=("Arial", 9), foreground="gray")
+        self.diff_status_label.pack(anchor=tk.W)
+
         # Code comparison frame
         comparison_frame = ttk.Frame(main_frame)
         comparison_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
@@ -70,7 +129,8 @@ class SimpleDiffViewer:
         original_frame.rowconfigure(0, weight=1)
 
         self.original_text = tk.Text(
-            original_frame, wrap=tk.NONE, font=("Consolas", 10), bg="#fff"
+            original_frame, wrap=tk.NONE, font=("Consolas", 10), bg="#fff", state=tk.DISABLED,
+            undo=False, autoseparators=False
         )
         self.original_text.grid(row=0, column=0, sticky="nsew")
 
@@ -105,7 +165,8 @@ class SimpleDiffViewer:
         modified_frame.rowconfigure(0, weight=1)
 
         self.modified_text = tk.Text(
-            modified_frame, wrap=tk.NONE, font=("Consolas", 10), bg="#fff"
+            modified_frame, wrap=tk.NONE, font=("Consolas", 10), bg="#fff", state=tk.DISABLED,
+            undo=False, autoseparators=False
         )
         self.modified_text.grid(row=0, column=0, sticky="nsew")
 
@@ -144,10 +205,10 @@ class SimpleDiffViewer:
         btn_frame = ttk.Frame(button_frame)
         btn_frame.pack()
 
-        ttk.Button(btn_frame, text="✓ Apply Changes",
-                  command=self.on_apply).pack(side=tk.LEFT, padx=5)
-        ttk.Button(btn_frame, text="✗ Skip File",
-                  command=self.on_skip).pack(side=tk.LEFT, padx=5)
+        self.apply_button = ttk.Button(btn_frame, text="✓ Apply Changes", command=self.on_apply)
+        self.apply_button.pack(side=tk.LEFT, padx=5)
+        self.skip_button = ttk.Button(btn_frame, text="✗ Skip File", command=self.on_skip)
+        self.skip_button.pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="⏹ Quit",
                   command=self.on_quit).pack(side=tk.LEFT, padx=5)
 
@@ -172,6 +233,10 @@ class SimpleDiffViewer:
         self.original_text.tag_configure("removed", background="#ffecec", foreground="#d73a49")
         self.modified_text.tag_configure("added", background="#e6ffed", foreground="#28a745")
 
+        # New tags stack above the selection; keep the selection visible over highlights
+        self.original_text.tag_raise("sel")
+        self.modified_text.tag_raise("sel")
+
     def sync_scrolling(self):
         """Synchronize scrolling between both text widgets."""
 
@@ -200,6 +265,10 @@ class SimpleDiffViewer:
         self.modified_text.bind("<Button-4>", lambda e: on_mousewheel(e, "modified"))
         self.modified_text.bind("<Button-5>", lambda e: on_mousewheel(e, "modified"))
 
+        # Resizing can expose rows that are not rendered yet
+        self.original_text.bind("<Configure>", lambda e: self.schedule_render())
+        self.modified_text.bind("<Configure>", lambda e: self.schedule_render())
+
     def sync_vertical_scroll(self, *args):
         """Synchronize vertical scrolling when scrollbar is used."""
         # Apply the scroll to both text widgets
@@ -218,6 +287,9 @@ class SimpleDiffViewer:
         self.original_v_scroll.set(*args)
         self.modified_v_scroll.set(*args)
 
+        # Scrolling can expose rows that are not rendered yet
+        self.schedule_render()
+
     def update_horizontal_scrollbars(self, *args):
         """Update both horizontal scrollbars when text widgets scroll."""
         # Update both scrollbars to show the same position
@@ -232,6 +304,10 @@ class SimpleDiffViewer:
         Returns:
             Tuple of (apply_changes, apply_to_all)
         """
+        if not changes_made and original_code == modified_code:
+            # Nothing to review; don't bring up the window
+            return False, self.apply_all_var.get()
+
         # Update file path
         self.file_label.config(text=f"File: {file_path}")
 
@@ -240,14 +316,7 @@ class SimpleDiffViewer:
         for change in changes_made:
             self.changes_text.insert(tk.END, f"• {change}\n")
 
-        # Show code
-        self.original_text.delete(1.0, tk.END)
-        self.original_text.insert(tk.END, original_code)
-
-        self.modified_text.delete(1.0, tk.END)
-        self.modified_text.insert(tk.END, modified_code)
-
-        # Apply syntax highlighting for changes
+        # Show code with syntax highlighting for changes
         self.highlight_changes_in_display(original_code, modified_code)
 
         # FIXED: Proper window visibility
@@ -260,19 +329,19 @@ class SimpleDiffViewer:
 
         # Reset result
         self.result = None
+        self._result_var.set("")
 
         # Show window and wait for result
         print(f"🎨 Showing GUI for {file_path}")
         print(f"🖥️  Window should now be visible - look for 'Python Style Converter - Diff Viewer'")
 
-        # Simple event loop - wait until user clicks a button
-        while self.result is None:
-            try:
-                self.root.update()
-            except tk.TclError:
-                # Window was closed
-                self.result = "quit"
-                break
+        # Block in Tk's event loop until a button sets the result variable
+        try:
+            self.root.wait_variable(self._result_var)
+            self.result = self._result_var.get() or "quit"
+        except tk.TclError:
+            # Window was destroyed
+            self.result = "quit"
 
         apply_to_all = self.apply_all_var.get()
 
@@ -284,120 +353,499 @@ class SimpleDiffViewer:
         return self.result == "apply", apply_to_all
 
     def highlight_changes_in_display(self, original_code: str, modified_code: str):
-        """Highlight changes in the displayed code."""
-        # Split into lines for comparison
-        original_lines = original_code.splitlines()
-        modified_lines = modified_code.splitlines()
+        """
+        Load both versions into the text widgets with their changes highlighted.
 
-        # Find line-by-line differences
-        matcher = difflib.SequenceMatcher(None, original_lines, modified_lines)
+        Large diffs are computed on a worker thread and displayed once ready, so
+        the window stays responsive meanwhile.
+        """
+        if self._pending_diff is not None:
+            # The diff still being computed is for a previous file
+            self._pending_diff = None
+            self.diff_status_label.config(text="")
+
+        key = (original_code, modified_code)
+        cached = self._diff_cache.get(key)
+        if cached is not None:
+            self._diff_cache.move_to_end(key)
+            self.display_diff(cached)
+            return
+
+        if len(original_code) + len(modified_code) <= _BACKGROUND_DIFF_SIZE:
+            self.display_diff(self.cache_diff(key, self.compute_diff(original_code, modified_code)))
+            return
+
+        # Don't leave the previous file on screen, or allow a choice, until the diff is shown
+        self.clear_documents()
+        self.set_choice_enabled(apply=False, skip=False)
+        self.diff_status_label.config(text="⏳ Computing diff…")
+        future = self._diff_executor.submit(self.compute_diff, original_code, modified_code)
+        self._pending_diff = future
+        self.root.after(_DIFF_POLL_MS, self.poll_diff, key, future)
+
+    def poll_diff(self, key: Tuple[str, str], future: Future):
+        """Display a diff from the worker thread once it is ready (runs on the Tk thread)."""
+        if future is not self._pending_diff:
+            # Superseded by a newer file
+            return
+
+        if not future.done():
+            self.root.after(_DIFF_POLL_MS, self.poll_diff, key, future)
+            return
+
+        self._pending_diff = None
 
-        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        try:
+            diff = future.result()
+        except Exception as e:
+            # Nothing to review, so the file can only be skipped
+            self.diff_status_label.config(text=f"❌ Could not compute diff: {e}")
+            self.set_choice_enabled(apply=False, skip=True)
+            return
+
+        self.diff_status_label.config(text="")
+        self.display_diff(self.cache_diff(key, diff))
+
+    def cache_diff(self, key: Tuple[str, str], diff: tuple) -> tuple:
+        """Remember a computed diff for re-display and return it."""
+        self._diff_cache[key] = diff
+        if len(self._diff_cache) > _DIFF_CACHE_SIZE:
+            self._diff_cache.popitem(last=False)
+        return diff
+
+    def compute_diff(self, original_code: str, modified_code: str) -> tuple:
+        """
+        Compute the lines and highlight tags of both versions.
+
+        Does not touch any widget, so it is safe to run off the Tk thread.
+
+        Returns:
+            Tuple of (original_lines, modified_lines, original_tags, modified_tags)
+        """
+        original_lines, modified_lines, opcodes = self.get_line_diff(original_code, modified_code)
+        original_tags, modified_tags = self.compute_line_tags(original_lines, modified_lines, opcodes)
+        return original_lines, modified_lines, original_tags, modified_tags
+
+    def display_diff(self, diff: tuple):
+        """
+        Show a computed diff in the text widgets.
+
+        Only the rows around the viewport are rendered right away; the rest are
+        rendered as they are scrolled into view.
+        """
+        original_lines, modified_lines, original_tags, modified_tags = diff
+
+        self.load_document(self.original_text, original_lines, original_tags)
+        self.load_document(self.modified_text, modified_lines, modified_tags)
+
+        self.render_visible_lines()
+        self.set_choice_enabled(apply=True, skip=True)
+
+    def set_choice_enabled(self, apply: bool, skip: bool):
+        """Enable or disable the Apply and Skip buttons."""
+        self.apply_button.config(state=tk.NORMAL if apply else tk.DISABLED)
+        self.skip_button.config(state=tk.NORMAL if skip else tk.DISABLED)
+
+    def clear_documents(self):
+        """Empty both code widgets and forget the documents they showed."""
+        for text_widget in (self.original_text, self.modified_text):
+            self._begin_update(text_widget)
+            text_widget.delete(1.0, tk.END)
+            self._end_update(text_widget)
+        self._documents.clear()
+
+    def compute_line_tags(self, original_lines: List[str], modified_lines: List[str],
+                          opcodes: list) -> Tuple[Dict[int, list], Dict[int, list]]:
+        """
+        Work out which highlight tags apply to which lines.
+
+        Args:
+            original_lines: Lines of the original code
+            modified_lines: Lines of the modified code
+            opcodes: Line-level diff opcodes between the two
+
+        Returns:
+            Tuple of (original_tags, modified_tags), each mapping a line index to a
+            list of (tag, start_column, end_column) with end_column None for line end
+        """
+        original_tags = {}
+        modified_tags = {}
+
+        for tag, i1, i2, j1, j2 in opcodes:
             if tag == 'replace':
                 # Lines that were changed - highlight the specific differences
                 for orig_idx, mod_idx in zip(range(i1, i2), range(j1, j2)):
-                    if orig_idx < len(original_lines) and mod_idx < len(modified_lines):
-                        self.highlight_line_changes(
-                            original_lines[orig_idx], modified_lines[mod_idx],
-                            orig_idx, mod_idx
-                        )
+                    removed_spans, added_spans = self.get_changed_spans(
+                        original_lines[orig_idx], modified_lines[mod_idx]
+                    )
+                    if removed_spans:
+                        original_tags[orig_idx] = [("removed_word", start, end) for start, end in removed_spans]
+                    if added_spans:
+                        modified_tags[mod_idx] = [("added_word", start, end) for start, end in added_spans]
             elif tag == 'delete':
                 # Lines that were removed
                 for orig_idx in range(i1, i2):
-                    if orig_idx < len(original_lines):
-                        line_start = self.get_line_start_position(self.original_text, orig_idx)
-                        line_end = self.get_line_end_position(self.original_text, orig_idx)
-                        self.original_text.tag_add("removed_line", line_start, line_end)
+                    original_tags[orig_idx] = [("removed_line", 0, None)]
 
             elif tag == 'insert':
                 # Lines that were added
                 for mod_idx in range(j1, j2):
-                    if mod_idx < len(modified_lines):
-                        line_start = self.get_line_start_position(self.modified_text, mod_idx)
-                        line_end = self.get_line_end_position(self.modified_text, mod_idx)
-                        self.modified_text.tag_add("added_line", line_start, line_end)
-
-    def highlight_line_changes(self, original_line: str, modified_line: str,
-                             orig_line_idx: int, mod_line_idx: int):
-        """Highlight specific word changes within a line."""
-        # Tokenize the lines to find word-level differences
-        orig_words = re.findall(r'\w+', original_line)
-        mod_words = re.findall(r'\w+', modified_line)
-
-        # Find different words
-        orig_words_set = set(orig_words)
-        mod_words_set = set(mod_words)
-
-        # Words that were removed (in original but not in modified)
-        removed_words = orig_words_set - mod_words_set
-        # Words that were added (in modified but not in original)
-        added_words = mod_words_set - orig_words_set
-
-        # Highlight removed words in original text
-        for word in removed_words:
-            self.highlight_word_in_line(self.original_text, word, orig_line_idx, "removed_word")
-
-        # Highlight added words in modified text
-        for word in added_words:
-            self.highlight_word_in_line(self.modified_text, word, mod_line_idx, "added_word")
-
-    def highlight_word_in_line(self, text_widget: tk.Text, word: str, line_idx: int, tag: str):
-        """Highlight a specific word in a specific line of a text widget."""
-        line_start = f"{line_idx + 1}.0"
-        line_end = f"{line_idx + 1}.end"
-
-        # Get the line content
-        line_content = text_widget.get(line_start, line_end)
-
-        # Find all occurrences of the word in the line
-        start_pos = 0
-        while True:
-            word_pos = line_content.find(word, start_pos)
-            if word_pos == -1:
-                break
-
-            # Check if it's a whole word (not part of another word)
-            if (word_pos == 0 or not line_content[word_pos - 1].isalnum()) and \
-               (word_pos + len(word) >= len(line_content) or not line_content[word_pos + len(word)].isalnum()):
-
-                word_start = f"{line_idx + 1}.{word_pos}"
-                word_end = f"{line_idx + 1}.{word_pos + len(word)}"
-                text_widget.tag_add(tag, word_start, word_end)
-
-            start_pos = word_pos + 1
-
-    def get_line_start_position(self, text_widget: tk.Text, line_idx: int) -> str:
-        """Get the start position of a line in a text widget."""
-        return f"{line_idx + 1}.0"
-
-    def get_line_end_position(self, text_widget: tk.Text, line_idx: int) -> str:
-        """Get the end position of a line in a text widget."""
-        return f"{line_idx + 1}.end"
+                    modified_tags[mod_idx] = [("added_line", 0, None)]
+
+        return original_tags, modified_tags
+
+    def load_document(self, text_widget: tk.Text, lines: List[str], line_tags: Dict[int, list]):
+        """
+        Show a document in a widget as placeholder rows for lazy rendering.
+
+        If the widget already holds a document, only the rows that differ are
+        replaced; unchanged rows keep their rendered text.
+        """
+        previous = self._documents.get(text_widget)
+        rendered = bytearray(len(lines))
+        self.ensure_line_positions(len(lines))
+
+        self._begin_update(text_widget)
+        if previous is None:
+            text_widget.delete(1.0, tk.END)
+            # One empty row per line keeps the scrollbar proportional to the full document
+            text_widget.insert(tk.END, "\n" * (len(lines) - 1))
+        else:
+            self.patch_document(text_widget, previous, lines, line_tags, rendered)
+        text_widget.mark_set(tk.INSERT, "1.0")
+        self._end_update(text_widget)
+
+        self._documents[text_widget] = (lines, line_tags, rendered)
+
+    def patch_document(self, text_widget: tk.Text, previous: tuple, lines: List[str],
+                       line_tags: Dict[int, list], rendered: bytearray):
+        """
+        Edit the previously loaded document into the new one row by row.
+
+        Args:
+            text_widget: Widget showing the previous document
+            previous: The widget's previous (lines, line_tags, rendered) document
+            lines: Lines of the new document
+            line_tags: Highlight tags of the new document
+            rendered: Rendered flags of the new document, filled in for reused rows
+        """
+        previous_lines, previous_tags, previous_rendered = previous
+        opcodes = self.diff_line_lists(previous_lines, lines, autojunk=False)
+        retag_lines = []
+
+        # Patch from the bottom up so the row numbers of earlier opcodes stay valid
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag == 'equal':
+                rendered[j1:j2] = previous_rendered[i1:i2]
+                for previous_idx, line_idx in zip(range(i1, i2), range(j1, j2)):
+                    if rendered[line_idx] and previous_tags.get(previous_idx) != line_tags.get(line_idx):
+                        retag_lines.append(line_idx)
+                continue
+
+            placeholders = "\n" * (j2 - j1)
+            if i2 < len(previous_lines):
+                start, end = self._line_starts[i1], self._line_starts[i2]
+            elif i1 > 0:
+                # The last row has no newline of its own, so take the one before the run
+                start, end = self._line_ends[i1 - 1], "end-1c"
+            else:
+                # Whole document; an empty widget already shows one row
+                start, end = "1.0", "end-1c"
+                placeholders = placeholders[1:]
+
+            text_widget.delete(start, end)
+            if placeholders:
+                text_widget.insert(start, placeholders)
+
+        if retag_lines:
+            self.retag_lines(text_widget, retag_lines, line_tags)
+
+    def retag_lines(self, text_widget: tk.Text, line_indices: List[int], line_tags: Dict[int, list]):
+        """Replace the highlight tags on already rendered lines."""
+        line_starts = self._line_starts
+        line_ends = self._line_ends
+        line_ranges = []
+        tag_ranges = {}
+
+        for line_idx in line_indices:
+            row = line_idx + 1
+            line_ranges.extend((line_starts[line_idx], line_ends[line_idx]))
+            for tag, start, end in line_tags.get(line_idx, ()):
+                tag_ranges.setdefault(tag, []).append(
+                    (f"{row}.{start}", line_ends[line_idx] if end is None else f"{row}.{end}")
+                )
+
+        for tag in _HIGHLIGHT_TAGS:
+            text_widget.tag_remove(tag, *line_ranges)
+        for tag, ranges in tag_ranges.items():
+            self.add_tag_ranges(text_widget, tag, ranges)
+
+    def ensure_line_positions(self, line_count: int):
+        """Make sure the cached line start/end index strings cover line_count lines."""
+        if line_count > len(self._line_starts):
+            rows = range(1, line_count + 1)
+            self._line_starts = tuple([f"{row}.0" for row in rows])
+            self._line_ends = tuple([f"{row}.end" for row in rows])
+
+    def schedule_render(self):
+        """Render newly exposed rows once Tk is idle, coalescing repeated requests."""
+        if not self._render_pending:
+            self._render_pending = True
+            self.root.after_idle(self.render_visible_lines)
+
+    def render_visible_lines(self):
+        """Render the visible rows, plus some overscan, of both text widgets."""
+        self._render_pending = False
+
+        for text_widget in (self.original_text, self.modified_text):
+            document = self._documents.get(text_widget)
+            if not document:
+                continue
+
+            first_visible = int(text_widget.index("@0,0").split(".")[0]) - 1
+            last_visible = int(text_widget.index(f"@0,{text_widget.winfo_height()}").split(".")[0])
+
+            self.render_lines(
+                text_widget,
+                max(0, first_visible - _OVERSCAN_LINES),
+                min(len(document[0]), last_visible + _OVERSCAN_LINES)
+            )
+
+    def render_lines(self, text_widget: tk.Text, lo: int, hi: int):
+        """Replace the placeholder rows in [lo, hi) with their text and highlight tags."""
+        lines, line_tags, rendered = self._documents[text_widget]
+        updating = False
+
+        line_idx = lo
+        while line_idx < hi:
+            if rendered[line_idx]:
+                line_idx += 1
+                continue
+
+            # Collect a run of consecutive placeholder rows as (text, tags) segments
+            run_start = line_idx
+            segments = []
+            while line_idx < hi and not rendered[line_idx]:
+                rendered[line_idx] = 1
+                if line_idx > run_start:
+                    segments.extend(("\n", ()))
+                segments.extend(self.get_line_segments(lines[line_idx], line_tags.get(line_idx, ())))
+                line_idx += 1
+
+            if not updating:
+                self._begin_update(text_widget)
+                updating = True
+
+            # Swap the placeholders for the tagged text in a single insert call
+            text_widget.delete(self._line_starts[run_start], self._line_ends[line_idx - 1])
+            text_widget.insert(self._line_starts[run_start], *segments)
+
+        if updating:
+            self._end_update(text_widget)
+
+    @staticmethod
+    def _begin_update(text_widget: tk.Text):
+        """Make a read-only code widget editable for a batch of programmatic edits."""
+        text_widget.config(state=tk.NORMAL)
+
+    @staticmethod
+    def _end_update(text_widget: tk.Text):
+        """Make a code widget read-only again after a batch of edits."""
+        text_widget.config(state=tk.DISABLED)
+
+    @staticmethod
+    def get_line_segments(line: str, tags: list) -> list:
+        """
+        Split a line into alternating text and tag-tuple arguments for Text.insert.
+
+        Args:
+            line: Line content
+            tags: Sorted, non-overlapping (tag, start_column, end_column) spans,
+                  with end_column None for line end
+
+        Returns:
+            Flat list of text, tags, text, tags, ... covering the whole line
+        """
+        segments = []
+        position = 0
+
+        for tag, start, end in tags:
+            if end is None:
+                end = len(line)
+            if start > position:
+                segments.extend((line[position:start], ()))
+            segments.extend((line[start:end], (tag,)))
+            position = end
+
+        if position < len(line) or not segments:
+            segments.extend((line[position:], ()))
+
+        return segments
+
+    def get_line_diff(self, original_code: str, modified_code: str) -> Tuple[List[str], List[str], list]:
+        """
+        Split both versions into lines and compute their line-level diff opcodes.
+
+        Args:
+            original_code: Original source code
+            modified_code: Modified source code
+
+        Returns:
+            Tuple of (original_lines, modified_lines, opcodes)
+        """
+        if original_code == modified_code:
+            # Nothing to diff; both sides share one line list
+            lines = original_code.splitlines()
+            return lines, lines, [('equal', 0, len(lines), 0, len(lines))] if lines else []
+
+        # Split into lines for comparison
+        original_lines = original_code.splitlines()
+        modified_lines = modified_code.splitlines()
+
+        # Find line-by-line differences
+        opcodes = self.diff_line_lists(original_lines, modified_lines)
+
+        return original_lines, modified_lines, opcodes
+
+    @staticmethod
+    def diff_line_lists(a: List[str], b: List[str], autojunk: bool = True) -> list:
+        """
+        Compute diff opcodes between two lists of lines.
+
+        The common leading and trailing lines are matched directly, so only the
+        changed middle is handed to the diff algorithm.
+
+        Args:
+            a: Lines before
+            b: Lines after
+            autojunk: Passed on to SequenceMatcher
+
+        Returns:
+            List of (tag, i1, i2, j1, j2) opcodes covering both lists
+        """
+        len_a, len_b = len(a), len(b)
+        shortest = min(len_a, len_b)
+
+        prefix = 0
+        while prefix < shortest and a[prefix] == b[prefix]:
+            prefix += 1
+
+        suffix = 0
+        while suffix < shortest - prefix and a[len_a - 1 - suffix] == b[len_b - 1 - suffix]:
+            suffix += 1
+
+        middle_a = a[prefix:len_a - suffix]
+        middle_b = b[prefix:len_b - suffix]
+
+        if not middle_a and not middle_b:
+            middle_opcodes = []
+        elif Levenshtein is not None and max(len(middle_a), len(middle_b)) >= _RAPIDFUZZ_MIN_LINES:
+            # Scales with the number of edits rather than with matching blocks
+            middle_opcodes = Levenshtein.opcodes(middle_a, middle_b).as_list()
+        else:
+            middle_opcodes = SequenceMatcher(None, middle_a, middle_b, autojunk=autojunk).get_opcodes()
+
+        opcodes = [('equal', 0, prefix, 0, prefix)] if prefix else []
+        opcodes.extend(
+            (tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix)
+            for tag, i1, i2, j1, j2 in middle_opcodes
+        )
+        if suffix:
+            opcodes.append(('equal', len_a - suffix, len_a, len_b - suffix, len_b))
+
+        return opcodes
+
+    @staticmethod
+    def add_tag_ranges(text_widget: tk.Text, tag: str, ranges: List[Tuple[str, str]]):
+        """Apply a tag to many (start, end) index pairs with one Tk call."""
+        if ranges:
+            # Tk's "tag add" accepts any number of interleaved index pairs
+            text_widget.tag_add(tag, *[index for index_pair in ranges for index in index_pair])
+
+    @staticmethod
+    def get_changed_spans(original_line: str, modified_line: str) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """
+        Find the character spans that differ between two versions of a line.
+
+        Both lines are split into word and non-word tokens, which are then diffed
+        in order, so repeated tokens and their positions are handled correctly.
+
+        Args:
+            original_line: Line from the original code
+            modified_line: Corresponding line from the modified code
+
+        Returns:
+            Tuple of (removed_spans, added_spans) as (start, end) column pairs
+        """
+        # Tokenize the lines, keeping each token's character span
+        orig_tokens = [(m.group(), m.start(), m.end()) for m in _TOKEN_RE.finditer(original_line)]
+        mod_tokens = [(m.group(), m.start(), m.end()) for m in _TOKEN_RE.finditer(modified_line)]
+
+        matcher = SequenceMatcher(
+            None, [token[0] for token in orig_tokens], [token[0] for token in mod_tokens]
+        )
+
+        removed_spans = []
+        added_spans = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            # One span per opcode, from the first to the last changed token
+            if tag in ('replace', 'delete'):
+                removed_spans.append((orig_tokens[i1][1], orig_tokens[i2 - 1][2]))
+            if tag in ('replace', 'insert'):
+                added_spans.append((mod_tokens[j1][1], mod_tokens[j2 - 1][2]))
+
+        return removed_spans, added_spans
+
+    def is_alive(self) -> bool:
+        """Check whether the Tk window still exists."""
+        try:
+            return bool(self.root.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def _reset_state(self):
+        """Hide the window and clear everything shown for the last file, keeping the widgets."""
+        self.root.withdraw()
+
+        self.result = None
+        self._result_var.set("")
+        self.apply_all_var.set(False)
+
+        self._pending_diff = None
+        self.diff_status_label.config(text="")
+        self.file_label.config(text="")
+        self.changes_text.delete(1.0, tk.END)
+        self.clear_documents()
 
     def center_window(self):
-        """Center the window on screen."""
+        """Center the window on screen the first time it is shown."""
+        if self._centered:
+            # Hiding keeps the window's place, including where the user moved it
+            return
+
         self.root.update_idletasks()
         width = self.root.winfo_width()
         height = self.root.winfo_height()
         x = (self.root.winfo_screenwidth() // 2) - (width // 2)
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f"{width}x{height}+{x}+{y}")
+        self._centered = True
 
     def on_apply(self):
         """Handle Apply button click."""
         print("🟢 User clicked Apply")
-        self.result = "apply"
+        self._result_var.set("apply")
 
     def on_skip(self):
         """Handle Skip button click."""
         print("🟡 User clicked Skip")
-        self.result = "skip"
+        self._result_var.set("skip")
 
     def on_quit(self):
         """Handle Quit button click."""
         if messagebox.askyesno("Quit", "Are you sure you want to quit?"):
             print("🔴 User clicked Quit")
-            self.result = "quit"
+            self._result_var.set("quit")
 
 
 # Global GUI instance to reuse
@@ -420,8 +868,8 @@ def show_diff_gui(file_path: Path, original_code: str, modified_code: str,
     global _gui_instance
 
     try:
-        # Create GUI instance if needed
-        if _gui_instance is None:
+        # Create GUI instance if needed; a live window is always reused
+        if _gui_instance is None or not _gui_instance.is_alive():
             print("🔧 Creating new GUI instance")
             _gui_instance = SimpleDiffViewer()
 
@@ -435,13 +883,13 @@ def show_diff_gui(file_path: Path, original_code: str, modified_code: str,
         import traceback
         traceback.print_exc()
 
-        # Clean up broken GUI instance
+        # Keep the window for the next file, just hide it and forget this one
         if _gui_instance:
             try:
-                _gui_instance.root.destroy()
-            except:
-                pass
-            _gui_instance = None
+                _gui_instance._reset_state()
+            except tk.TclError:
+                # The window itself is gone; it is rebuilt on the next call
+                _gui_instance = None
 
         raise e
 
@@ -451,6 +899,7 @@ def cleanup_gui():
     global _gui_instance
     if _gui_instance:
         try:
+            _gui_instance._diff_executor.shutdown(wait=False, cancel_futures=True)
             _gui_instance.root.destroy()
         except:
             pass
@@ -5,7 +5,9 @@ Always uses cross-file mode with smart GUI behavior.
 
 import sys
 import argparse
+import itertools
 from pathlib import Path
+from typing import Iterable
 
 from config.config_manager import ConfigManager, ConfigValidationError
 from core.file_scanner import FileScanner
@@ -67,20 +69,19 @@ Examples:
         if target_path.is_file():
             files_to_process = file_scanner.scan_file(str(target_path))
         elif target_path.is_dir():
-            files_to_process = file_scanner.scan_directory(str(target_path))
+            # Stream files from a background scan so analysis starts on the first ones
+            files_to_process = file_scanner.stream_directory(str(target_path))
         else:
             print(f"❌ Error: Target path does not exist: {target_path}")
             sys.exit(1)
 
-        if not files_to_process:
+        # A streamed scan can only be checked for files by taking the first one
+        files_to_process = iter(files_to_process)
+        first_file = next(files_to_process, None)
+        if first_file is None:
             print("ℹ️  No Python files found matching the configured patterns.")
             sys.exit(0)
-
-        if args.verbose:
-            print(f"📁 Found {len(files_to_process)} files to process:")
-            for file_path in files_to_process:
-                print(f"  - {file_path}")
-            print()
+        files_to_process = itertools.chain((first_file,), files_to_process)
 
         # Always use cross-file processing
         result = process_cross_file_mode(config_manager, files_to_process, args)
@@ -111,10 +112,12 @@ Examples:
 
 
 def process_cross_file_mode(config_manager: ConfigManager,
-                          files_to_process: list,
+                          files_to_process: Iterable[Path],
                           args) -> dict:
     """
     Process files with cross-file coordination and smart GUI behavior.
+
+    files_to_process may be a streaming scanner; it is consumed once by the symbol analysis.
     """
     try:
         # Step 1: Analyze project for cross-file symbols
@@ -124,8 +127,15 @@ def process_cross_file_mode(config_manager: ConfigManager,
         symbol_tracker = GlobalSymbolTracker(project_root)
         global_symbol_map = symbol_tracker.analyze_project(files_to_process)
 
+        # The analysis records every file it consumed, in scan order
+        files_to_process = list(global_symbol_map.file_to_module)
+
         if args.verbose:
             print(f"   📊 Analysis complete: found symbols across {len(files_to_process)} files")
+            print(f"📁 Found {len(files_to_process)} files to process:")
+            for file_path in files_to_process:
+                print(f"  - {file_path}")
+            print()
 
         # Step 2: Process all files with RuleEngine
         print("🎯 Step 2: Processing files with cross-file transformations...")
@@ -11,7 +11,7 @@ from config.config_manager import ConfigManager
 from core.ast_analyzer import CodeElement
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleResult:
     """Result of applying a single rule."""
     rule_name: str
@@ -24,6 +24,13 @@ class RuleResult:
 class BaseRule(ABC):
     """Abstract base class for all transformation rules."""
 
+    rule_name: str
+
+    def __init_subclass__(cls, **kwargs):
+        """Derive the rule name from the class name once per rule class."""
+        super().__init_subclass__(**kwargs)
+        cls.rule_name = cls.__name__.lower().replace('rule', '')
+
     def __init__(self, config_manager: ConfigManager):
         """
         Initialize the rule with configuration.
@@ -32,7 +39,6 @@ class BaseRule(ABC):
             config_manager: ConfigManager instance with loaded configuration
         """
         self.config = config_manager
-        self.rule_name = self.__class__.__name__.lower().replace('rule', '')
 
     @abstractmethod
     def is_enabled(self) -> bool:
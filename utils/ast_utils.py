@@ -4,7 +4,153 @@ Provides helper functions for working with Python Abstract Syntax Trees.
 """
 
 import ast
-from typing import List, Dict, Set, Optional, Any, Tuple, Union
+from collections import deque
+from dataclasses import dataclass, field
+from typing import List, Dict, Set, FrozenSet, Optional, Any, Tuple, Union
+from weakref import WeakKeyDictionary
+
+
+@dataclass(slots=True)
+class _CollectedNodes:
+    """Nodes of one tree sorted into the categories the ASTHelper queries use."""
+    names: Set[str] = field(default_factory=set)
+    functions: List[ast.AST] = field(default_factory=list)
+    classes: List[ast.ClassDef] = field(default_factory=list)
+    assignments: List[ast.AST] = field(default_factory=list)
+    imports: List[Tuple[str, Optional[str]]] = field(default_factory=list)
+    strings: List[str] = field(default_factory=list)
+    function_by_name: Dict[str, ast.AST] = field(default_factory=dict)  # first definition per name
+    class_by_name: Dict[str, ast.ClassDef] = field(default_factory=dict)  # first definition per name
+    class_methods: Dict[str, Set[str]] = field(default_factory=dict)  # methods of class_by_name entries
+    complexity: int = 0
+
+
+# Node types any category cares about; everything else is skipped with one set lookup
+_COLLECTED_TYPES = frozenset({
+    ast.Name, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Assign, ast.AnnAssign,
+    ast.Import, ast.ImportFrom, ast.Constant, ast.If, ast.While, ast.For, ast.AsyncFor,
+    ast.ExceptHandler
+})
+_FUNCTION_TYPES = frozenset({ast.FunctionDef, ast.AsyncFunctionDef})
+_ASSIGNMENT_TYPES = frozenset({ast.Assign, ast.AnnAssign})
+# Decision points counted by count_complexity besides function and class definitions
+_DECISION_POINT_TYPES = frozenset({ast.If, ast.While, ast.For, ast.AsyncFor, ast.ExceptHandler})
+
+# Collected nodes per tree, dropped together with the tree
+_collected_trees: "WeakKeyDictionary[ast.AST, _CollectedNodes]" = WeakKeyDictionary()
+
+
+def _collect(tree: ast.AST) -> _CollectedNodes:
+    """
+    Sort all nodes of a tree into categories with a single traversal.
+
+    The traversal visits nodes in the same breadth-first order as ast.walk but
+    reads child fields directly instead of going through the ast.walk and
+    ast.iter_child_nodes generators. Nodes are dispatched on their exact type.
+
+    The result is cached per tree object, so the ASTHelper queries on the same
+    tree share one traversal. Trees are assumed not to change once queried.
+
+    Args:
+        tree: AST to collect from
+
+    Returns:
+        _CollectedNodes for the tree, in ast.walk order
+    """
+    collected = _collected_trees.get(tree)
+    if collected is not None:
+        return collected
+
+    collected = _CollectedNodes()
+    complexity = 0
+    queue = deque((tree,))
+    popleft = queue.popleft
+    append = queue.append
+    AST = ast.AST
+
+    while queue:
+        node = popleft()
+        for field_name in node._fields:
+            value = getattr(node, field_name, None)
+            if isinstance(value, AST):
+                append(value)
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, AST):
+                        append(item)
+
+        node_type = node.__class__
+        if node_type not in _COLLECTED_TYPES:
+            continue
+
+        if node_type is ast.Name:
+            collected.names.add(node.id)
+        elif node_type is ast.Constant:
+            if isinstance(node.value, str):
+                collected.strings.append(node.value)
+        elif node_type in _DECISION_POINT_TYPES:
+            complexity += 1
+        elif node_type in _FUNCTION_TYPES:
+            collected.names.add(node.name)
+            collected.functions.append(node)
+            collected.function_by_name.setdefault(node.name, node)
+            complexity += 1
+        elif node_type is ast.ClassDef:
+            collected.names.add(node.name)
+            collected.classes.append(node)
+            if node.name not in collected.class_by_name:
+                collected.class_by_name[node.name] = node
+                collected.class_methods[node.name] = {
+                    statement.name for statement in node.body
+                    if statement.__class__ in _FUNCTION_TYPES
+                }
+            complexity += 1
+        elif node_type in _ASSIGNMENT_TYPES:
+            collected.assignments.append(node)
+        elif node_type is ast.Import:
+            for alias in node.names:
+                collected.imports.append((alias.name, alias.asname))
+        else:
+            module = node.module or ''
+            for alias in node.names:
+                full_name = f"{module}.{alias.name}" if module else alias.name
+                collected.imports.append((full_name, alias.asname))
+
+    collected.complexity = complexity
+    _collected_trees[tree] = collected
+    return collected
+
+
+# Nodes that can contain function and class definitions; expressions never do
+_DEFINITION_CONTAINERS = (ast.mod, ast.stmt, ast.excepthandler, ast.match_case)
+
+
+def _find_definition(tree: ast.AST, node_types: tuple, name: str) -> Optional[ast.AST]:
+    """
+    Find the first definition named name, in ast.walk order, without a full walk.
+
+    Expression subtrees are skipped and the search stops at the first match.
+
+    Args:
+        tree: AST to search
+        node_types: Definition node types to match
+        name: Name of the definition
+
+    Returns:
+        Matching node if found, None otherwise
+    """
+    queue = deque([tree])
+
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, node_types) and node.name == name:
+            return node
+        queue.extend(
+            child for child in ast.iter_child_nodes(node)
+            if isinstance(child, _DEFINITION_CONTAINERS)
+        )
+
+    return None
 
 
 class ASTHelper:
@@ -21,19 +167,7 @@ class ASTHelper:
         Returns:
             Set of all identifier names found
         """
-        names = set()
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Name):
-                names.add(node.id)
-            elif isinstance(node, ast.FunctionDef):
-                names.add(node.name)
-            elif isinstance(node, ast.AsyncFunctionDef):
-                names.add(node.name)
-            elif isinstance(node, ast.ClassDef):
-                names.add(node.name)
-
-        return names
+        return set(_collect(tree).names)
 
     @staticmethod
     def find_function_definitions(tree: ast.AST) -> List[ast.FunctionDef]:
@@ -46,13 +180,7 @@ class ASTHelper:
         Returns:
             List of FunctionDef nodes
         """
-        functions = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                functions.append(node)
-
-        return functions
+        return list(_collect(tree).functions)
 
     @staticmethod
     def find_class_definitions(tree: ast.AST) -> List[ast.ClassDef]:
@@ -65,13 +193,7 @@ class ASTHelper:
         Returns:
             List of ClassDef nodes
         """
-        classes = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                classes.append(node)
-
-        return classes
+        return list(_collect(tree).classes)
 
     @staticmethod
     def find_variable_assignments(tree: ast.AST) -> List[ast.Assign]:
@@ -84,13 +206,7 @@ class ASTHelper:
         Returns:
             List of Assign nodes
         """
-        assignments = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.Assign, ast.AnnAssign)):
-                assignments.append(node)
-
-        return assignments
+        return list(_collect(tree).assignments)
 
     @staticmethod
     def get_node_name(node: ast.AST) -> Optional[str]:
@@ -103,12 +219,10 @@ class ASTHelper:
         Returns:
             Name string if node has a name, None otherwise
         """
-        if hasattr(node, 'name'):
-            return node.name
-        elif hasattr(node, 'id'):
-            return node.id
-        else:
-            return None
+        name = getattr(node, 'name', None)
+        if name is not None:
+            return name
+        return getattr(node, 'id', None)
 
     @staticmethod
     def is_private_name(name: str) -> bool:
@@ -121,7 +235,7 @@ class ASTHelper:
         Returns:
             True if name is private (starts with underscore)
         """
-        return name.startswith('_') and not name.startswith('__')
+        return name[:1] == '_' and name[1:2] != '_'
 
     @staticmethod
     def is_dunder_name(name: str) -> bool:
@@ -134,7 +248,7 @@ class ASTHelper:
         Returns:
             True if name is dunder (starts and ends with double underscore)
         """
-        return name.startswith('__') and name.endswith('__') and len(name) > 4
+        return len(name) > 4 and name[0] == '_' and name[1] == '_' and name[-1] == '_' and name[-2] == '_'
 
     @staticmethod
     def is_constant_name(name: str) -> bool:
@@ -161,11 +275,10 @@ class ASTHelper:
         Returns:
             FunctionDef node if found, None otherwise
         """
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                if node.name == target_function:
-                    return node
-        return None
+        collected = _collected_trees.get(tree)
+        if collected is not None:
+            return collected.function_by_name.get(target_function)
+        return _find_definition(tree, (ast.FunctionDef, ast.AsyncFunctionDef), target_function)
 
     @staticmethod
     def get_class_scope(tree: ast.AST, target_class: str) -> Optional[ast.ClassDef]:
@@ -179,11 +292,10 @@ class ASTHelper:
         Returns:
             ClassDef node if found, None otherwise
         """
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                if node.name == target_class:
-                    return node
-        return None
+        collected = _collected_trees.get(tree)
+        if collected is not None:
+            return collected.class_by_name.get(target_class)
+        return _find_definition(tree, (ast.ClassDef,), target_class)
 
     @staticmethod
     def get_imports(tree: ast.AST) -> List[Tuple[str, Optional[str]]]:
@@ -196,19 +308,7 @@ class ASTHelper:
         Returns:
             List of tuples (module_name, alias) for each import
         """
-        imports = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append((alias.name, alias.asname))
-            elif isinstance(node, ast.ImportFrom):
-                module = node.module or ''
-                for alias in node.names:
-                    full_name = f"{module}.{alias.name}" if module else alias.name
-                    imports.append((full_name, alias.asname))
-
-        return imports
+        return list(_collect(tree).imports)
 
     @staticmethod
     def find_string_literals(tree: ast.AST) -> List[str]:
@@ -221,15 +321,7 @@ class ASTHelper:
         Returns:
             List of string literal values
         """
-        strings = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Str):  # Python < 3.8
-                strings.append(node.s)
-            elif isinstance(node, ast.Constant) and isinstance(node.value, str):  # Python >= 3.8
-                strings.append(node.value)
-
-        return strings
+        return list(_collect(tree).strings)
 
     @staticmethod
     def has_decorator(func_node: ast.FunctionDef, decorator_name: str) -> bool:
@@ -250,6 +342,26 @@ class ASTHelper:
                 return True
         return False
 
+    @staticmethod
+    def get_decorator_names(func_node: ast.FunctionDef) -> FrozenSet[str]:
+        """
+        Get the names of a function's decorators, for checking several names at once.
+
+        Names are matched the same way as has_decorator: the id of a plain name
+        or the attribute of a dotted name.
+
+        Args:
+            func_node: FunctionDef node to check
+
+        Returns:
+            Set of decorator names
+        """
+        return frozenset(
+            decorator.id if decorator.__class__ is ast.Name else decorator.attr
+            for decorator in func_node.decorator_list
+            if decorator.__class__ is ast.Name or decorator.__class__ is ast.Attribute
+        )
+
     @staticmethod
     def get_node_line_range(node: ast.AST) -> Tuple[int, int]:
         """
@@ -263,17 +375,16 @@ class ASTHelper:
         """
         start_line = getattr(node, 'lineno', 0)
 
-        # Try to get end line from various attributes
-        end_line = start_line
-        if hasattr(node, 'end_lineno') and node.end_lineno:
-            end_line = node.end_lineno
-        elif hasattr(node, 'body') and node.body:
-            # For compound statements, find the last line of the body
-            last_stmt = node.body[-1]
-            if hasattr(last_stmt, 'lineno'):
-                end_line = last_stmt.lineno
+        end_line = getattr(node, 'end_lineno', None)
+        if end_line:
+            return start_line, end_line
+
+        body = getattr(node, 'body', None)
+        if body:
+            # For compound statements without end positions, use the last line of the body
+            return start_line, getattr(body[-1], 'lineno', start_line)
 
-        return start_line, end_line
+        return start_line, start_line
 
     @staticmethod
     def is_method_in_class(tree: ast.AST, method_name: str, class_name: str) -> bool:
@@ -288,16 +399,7 @@ class ASTHelper:
         Returns:
             True if method exists in the class, False otherwise
         """
-        class_node = ASTHelper.get_class_scope(tree, class_name)
-        if not class_node:
-            return False
-
-        for node in class_node.body:
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                if node.name == method_name:
-                    return True
-
-        return False
+        return method_name in _collect(tree).class_methods.get(class_name, ())
 
     @staticmethod
     def count_complexity(tree: ast.AST) -> int:
@@ -310,20 +412,7 @@ class ASTHelper:
         Returns:
             Complexity score (higher = more complex)
         """
-        complexity = 0
-
-        for node in ast.walk(tree):
-            # Count decision points
-            if isinstance(node, (ast.If, ast.While, ast.For, ast.AsyncFor)):
-                complexity += 1
-            elif isinstance(node, ast.ExceptHandler):
-                complexity += 1
-            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                complexity += 1
-            elif isinstance(node, ast.ClassDef):
-                complexity += 1
-
-        return complexity
+        return _collect(tree).complexity
 
     @staticmethod
     def validate_identifier(name: str) -> Tuple[bool, Optional[str]]:
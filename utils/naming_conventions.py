@@ -4,13 +4,51 @@ Provides functions to convert between different naming conventions.
 """
 
 import re
+from functools import lru_cache
 from typing import List, Tuple
 
+# Word boundaries of camelCase/PascalCase names, matched as empty positions: after a
+# lowercase letter or digit before a capital ("camelCase" -> "camel_Case"), and inside
+# a run of capitals before a capitalized word ("HTTPSConnection" -> "HTTPS_Connection")
+_WORD_BOUNDARY_RE = re.compile('(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])')
+
+# Words of a camelCase/PascalCase name, keeping acronyms together
+_COMPOUND_WORD_RE = re.compile(r'[A-Z]*[a-z]+|[A-Z]+(?=[A-Z][a-z]|\b)')
+
+# Conventions accepted by convert_to_convention, in documentation order
+_SUPPORTED_CONVENTIONS = (
+    "snake_case",
+    "camelCase",
+    "PascalCase",
+    "UPPER_CASE",
+    "_snake_case",
+    "_camelCase",
+    "__snake_case__",
+    "__camelCase__"
+)
+
+# Results remembered per converter; the same identifiers recur throughout a project
+_CONVERSION_CACHE_SIZE = 4096
+
+
+def _insert_word_underscores(name: str) -> str:
+    """
+    Insert underscores between the words of a camelCase or PascalCase name.
+
+    Args:
+        name: Name to split
+
+    Returns:
+        Name with an underscore at each word boundary, case unchanged
+    """
+    return _WORD_BOUNDARY_RE.sub('_', name)
+
 
 class NamingConverter:
     """Utility class for converting between naming conventions."""
 
     @staticmethod
+    @lru_cache(maxsize=_CONVERSION_CACHE_SIZE)
     def to_snake_case(name: str) -> str:
         """
         Convert name to snake_case.
@@ -34,15 +72,10 @@ class NamingConverter:
             return name
 
         # Convert camelCase and PascalCase to snake_case
-        # Insert underscore before uppercase letters that follow lowercase letters or digits
-        result = re.sub('([a-z0-9])([A-Z])', r'\1_\2', name)
-
-        # Handle sequences of uppercase letters (e.g., "HTTPSConnection" -> "HTTPS_Connection")
-        result = re.sub('([A-Z]+)([A-Z][a-z])', r'\1_\2', result)
-
-        return result.lower()
+        return _insert_word_underscores(name).lower()
 
     @staticmethod
+    @lru_cache(maxsize=_CONVERSION_CACHE_SIZE)
     def to_camel_case(name: str) -> str:
         """
         Convert name to camelCase.
@@ -66,12 +99,13 @@ class NamingConverter:
             parts = name.lower().split('_')
             if not parts:
                 return name
-            return parts[0] + ''.join(word.capitalize() for word in parts[1:])
+            return parts[0] + ''.join([word.capitalize() for word in parts[1:]])
         else:
             # Assume it's already in some form of camelCase/PascalCase
             return name[0].lower() + name[1:] if name else name
 
     @staticmethod
+    @lru_cache(maxsize=_CONVERSION_CACHE_SIZE)
     def to_pascal_case(name: str) -> str:
         """
         Convert name to PascalCase.
@@ -93,12 +127,13 @@ class NamingConverter:
         if '_' in name:
             # Convert from snake_case
             parts = name.lower().split('_')
-            return ''.join(word.capitalize() for word in parts if word)
+            return ''.join([word.capitalize() for word in parts if word])
         else:
             # Assume it's already in some form of camelCase/PascalCase
             return name[0].upper() + name[1:] if name else name
 
     @staticmethod
+    @lru_cache(maxsize=_CONVERSION_CACHE_SIZE)
     def to_upper_case(name: str) -> str:
         """
         Convert name to UPPER_CASE (screaming snake case).
@@ -119,12 +154,16 @@ class NamingConverter:
         """
         if '_' in name:
             return name.upper()
+        elif name.isascii():
+            # Convert camelCase/PascalCase to UPPER_CASE; for ASCII, uppercasing
+            # directly gives the same result as going through lowercase snake_case
+            return _insert_word_underscores(name).upper()
         else:
-            # Convert camelCase/PascalCase to UPPER_CASE
             snake_case = NamingConverter.to_snake_case(name)
             return snake_case.upper()
 
     @staticmethod
+    @lru_cache(maxsize=_CONVERSION_CACHE_SIZE)
     def detect_naming_convention(name: str) -> str:
         """
         Detect the naming convention of a given name.
@@ -149,33 +188,34 @@ class NamingConverter:
         if not name:
             return 'unknown'
 
-        # Check for UPPER_CASE (all uppercase with underscores)
-        if name.isupper() and ('_' in name or name.isalpha()):
+        # All cased characters uppercase: UPPER_CASE, with or without underscores
+        if name.isupper():
             return 'UPPER_CASE'
 
-        # Check for snake_case (lowercase with underscores)
-        if '_' in name and name.islower():
+        # All cased characters lowercase: snake_case, including single words
+        if name.islower():
             return 'snake_case'
 
-        # Check for PascalCase (starts with uppercase, no underscores)
-        if not '_' in name and name[0].isupper() and any(c.islower() for c in name):
-            return 'PascalCase'
-
-        # Check for camelCase (starts with lowercase, no underscores, has uppercase)
-        if not '_' in name and name[0].islower() and any(c.isupper() for c in name):
-            return 'camelCase'
-
-        # Check for single word lowercase
-        if name.islower() and '_' not in name:
-            return 'snake_case'
-
-        # Check for single word uppercase
-        if name.isupper() and '_' not in name:
-            return 'UPPER_CASE'
+        # Both cases mixed without underscores: PascalCase or camelCase by first letter
+        if '_' not in name:
+            first = name[0]
+            if name.isascii():
+                # No titlecase letters in ASCII, so both cases are known to be present
+                if first.isupper():
+                    return 'PascalCase'
+                if first.islower():
+                    return 'camelCase'
+            elif first.isupper():
+                if any(c.islower() for c in name):
+                    return 'PascalCase'
+            elif first.islower():
+                if any(c.isupper() for c in name):
+                    return 'camelCase'
 
         return 'mixed'
 
     @staticmethod
+    @lru_cache(maxsize=_CONVERSION_CACHE_SIZE)
     def convert_to_convention(name: str, target_convention: str) -> str:
         """
         Convert name to the specified naming convention.
@@ -192,28 +232,16 @@ class NamingConverter:
         Raises:
             ValueError: If target_convention is not supported
         """
-        if target_convention == "snake_case":
-            return NamingConverter.to_snake_case(name)
-        elif target_convention == "camelCase":
-            return NamingConverter.to_camel_case(name)
-        elif target_convention == "PascalCase":
-            return NamingConverter.to_pascal_case(name)
-        elif target_convention == "UPPER_CASE":
-            return NamingConverter.to_upper_case(name)
-        elif target_convention == "_snake_case":
-            base_name = NamingConverter.to_snake_case(name.lstrip('_'))
-            return f"_{base_name}"
-        elif target_convention == "_camelCase":
-            base_name = NamingConverter.to_camel_case(name.lstrip('_'))
-            return f"_{base_name}"
-        elif target_convention == "__snake_case__":
-            base_name = NamingConverter.to_snake_case(name.strip('_'))
-            return f"__{base_name}__"
-        elif target_convention == "__camelCase__":
-            base_name = NamingConverter.to_camel_case(name.strip('_'))
-            return f"__{base_name}__"
-        else:
-            raise ValueError(f"Unsupported naming convention: {target_convention}")
+        try:
+            converter, strip, prefix, suffix = _CONVENTION_CONVERTERS[target_convention]
+        except KeyError:
+            raise ValueError(f"Unsupported naming convention: {target_convention}") from None
+
+        if strip is None:
+            return converter(name)
+
+        base_name = converter(strip(name, '_'))
+        return f"{prefix}{base_name}{suffix}"
 
     @staticmethod
     def is_valid_python_identifier(name: str) -> bool:
@@ -229,23 +257,14 @@ class NamingConverter:
         return name.isidentifier()
 
     @staticmethod
-    def get_supported_conventions() -> List[str]:
+    def get_supported_conventions() -> Tuple[str, ...]:
         """
-        Get list of all supported naming conventions.
+        Get all supported naming conventions.
 
         Returns:
-            List of supported convention names
+            Tuple of supported convention names, shared between calls
         """
-        return [
-            "snake_case",
-            "camelCase",
-            "PascalCase",
-            "UPPER_CASE",
-            "_snake_case",
-            "_camelCase",
-            "__snake_case__",
-            "__camelCase__"
-        ]
+        return _SUPPORTED_CONVENTIONS
 
     @staticmethod
     def split_compound_name(name: str) -> List[str]:
@@ -269,8 +288,24 @@ class NamingConverter:
         if '_' in name:
             # Snake case variants
             return [part for part in name.split('_') if part]
+        elif name.isalpha() and name.isascii() and (name.islower() or name.isupper()):
+            # A single word in one case has no boundaries to find
+            return [name]
         else:
             # Camel case variants
             # Split on uppercase letters
-            parts = re.findall(r'[A-Z]*[a-z]+|[A-Z]+(?=[A-Z][a-z]|\b)', name)
-            return parts if parts else [name]
\ No newline at end of file
+            parts = _COMPOUND_WORD_RE.findall(name)
+            return parts if parts else [name]
+
+
+# Target convention -> (converter, str method stripping underscores first or None, prefix, suffix)
+_CONVENTION_CONVERTERS = {
+    "snake_case": (NamingConverter.to_snake_case, None, "", ""),
+    "camelCase": (NamingConverter.to_camel_case, None, "", ""),
+    "PascalCase": (NamingConverter.to_pascal_case, None, "", ""),
+    "UPPER_CASE": (NamingConverter.to_upper_case, None, "", ""),
+    "_snake_case": (NamingConverter.to_snake_case, str.lstrip, "_", ""),
+    "_camelCase": (NamingConverter.to_camel_case, str.lstrip, "_", ""),
+    "__snake_case__": (NamingConverter.to_snake_case, str.strip, "__", "__"),
+    "__camelCase__": (NamingConverter.to_camel_case, str.strip, "__", "__"),
+}